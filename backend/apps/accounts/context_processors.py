@@ -3,18 +3,26 @@ from __future__ import annotations
 from typing import Any
 
 def user_ui_context(request) -> dict[str, Any]:
+    cached = getattr(request, "_user_ui_context", None)
+    if cached is not None:
+        return cached
+
     user = getattr(request, "user", None)
     if not user or not getattr(user, "is_authenticated", False):
         return {}
 
-    display_name = user.get_full_name() or user.username
-    initials = "".join([p[0] for p in display_name.split()[:2] if p]) or display_name[:1]
+    first_name = user.first_name.strip()
+    last_name = user.last_name.strip()
+    display_name = f"{first_name} {last_name}".strip() or user.username
+    initials = first_name[:1] + last_name[:1] or display_name[:1]
     is_manager = user.is_manager
     position = getattr(getattr(user, "position", None), "name", None)
     header_role = "Manager" if is_manager else (position or "Employee")
 
-    return {
+    context = {
         "user_display_name": display_name,
         "user_initials": initials.upper(),
         "user_header_role": header_role,
     }
+    request._user_ui_context = context
+    return context
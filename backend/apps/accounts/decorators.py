@@ -10,9 +10,10 @@ def role_required(user_attr: str, redirect_to: str) -> Callable[[Callable[..., H
     def decorator(view_func: Callable[..., HttpResponse]) -> Callable[..., HttpResponse]:
         @wraps(view_func)
         def _wrapped(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
-            if not request.user.is_authenticated:
+            user = request.user
+            if not user.is_authenticated:
                 return redirect("login")
-            if not getattr(request.user, user_attr, False):
+            if not getattr(user, user_attr, False):
                 return redirect(redirect_to)
             return view_func(request, *args, **kwargs)
 
@@ -16,6 +16,8 @@ def _split_full_name(full_name: str) -> tuple[str, str]:
 class EmployeeBaseForm(forms.ModelForm):
     full_name = forms.CharField(label="Full name", max_length=150)
 
+    derived_fields = ["first_name", "last_name", "username"]
+
     class Meta:
         model = User
         fields = ["email", "position"]
@@ -50,7 +52,10 @@ class EmployeeBaseForm(forms.ModelForm):
         self._apply_full_name(user)
         self._apply_common(user)
         if commit:
-            user.save()
+            if user.pk:
+                user.save(update_fields=[*self._meta.fields, *self.derived_fields])
+            else:
+                user.save()
         return user
 
 class CreateEmployeeForm(EmployeeBaseForm):
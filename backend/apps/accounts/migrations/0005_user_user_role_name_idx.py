@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 02:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_user_email_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role', 'last_name', 'first_name', 'username'], name='user_role_name_idx'),
+        ),
+    ]
@@ -1,19 +1,19 @@
 from __future__ import annotations
 
 import secrets
-import string
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 
 def generate_employee_id() -> str:
-    return f"EMP-{secrets.randbelow(900000) + 100000}"
+    return f"EMP-{secrets.randbelow(9 * 10**11) + 10**11}"
 
 class UserRole(models.TextChoices):
     MANAGER = "manager", "Manager"
     EMPLOYEE = "employee", "Employee"
 
 class User(AbstractUser):
+    email = models.EmailField("email address", blank=True, db_index=True)
     role = models.CharField(max_length=20, choices=UserRole.choices, default=UserRole.EMPLOYEE)
     employee_id = models.CharField(max_length=20, unique=True, default=generate_employee_id, editable=False)
     position = models.ForeignKey(
@@ -23,6 +23,12 @@ class User(AbstractUser):
         blank=True,
         related_name="employees",
     )
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=["role", "last_name", "first_name", "username"], name="user_role_name_idx"),
+        ]
+
     @property
     def is_manager(self) -> bool:
         return self.role == UserRole.MANAGER
@@ -31,5 +37,4 @@ class User(AbstractUser):
         return self.role == UserRole.EMPLOYEE
     @staticmethod
     def generate_password(length: int = 14) -> str:
-        alphabet = string.ascii_letters + string.digits
-        return "".join(secrets.choice(alphabet) for _ in range(length))
+        return secrets.token_urlsafe(length)[:length]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import csv
+import io
+
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.scheduling.models import Position
+
+from .models import User, UserRole
+from .views import EMPLOYEES_EXPORT_HEADER, EMPLOYEES_PER_PAGE
+
+
+def _create_employee(index: int, **fields) -> User:
+    email = f"employee{index:03d}@example.com"
+    defaults = {"first_name": f"First{index:03d}", "last_name": f"Last{index:03d}"}
+    defaults.update(fields)
+    return User.objects.create_user(email, email=email, role=UserRole.EMPLOYEE, **defaults)
+
+
+class ManagerEmployeesTestBase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.manager = User.objects.create_user(
+            "manager@example.com", email="manager@example.com", password="pw", role=UserRole.MANAGER
+        )
+
+    def setUp(self):
+        self.client.force_login(self.manager)
+
+
+class ManagerEmployeesExportTests(ManagerEmployeesTestBase):
+    def _export_rows(self) -> list[list[str]]:
+        response = self.client.get(reverse("manager_employees_export"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn('filename="employees.csv"', response["Content-Disposition"])
+        body = b"".join(response.streaming_content).decode()
+        return list(csv.reader(io.StringIO(body)))
+
+    def test_exports_header_and_employees_in_name_order(self):
+        barista = Position.objects.create(name="Barista")
+        second = _create_employee(2, position=barista)
+        first = _create_employee(1)
+
+        rows = self._export_rows()
+
+        self.assertEqual(rows[0], list(EMPLOYEES_EXPORT_HEADER))
+        self.assertEqual(
+            rows[1:],
+            [
+                [first.employee_id, "First001", "Last001", "employee001@example.com", ""],
+                [second.employee_id, "First002", "Last002", "employee002@example.com", "Barista"],
+            ],
+        )
+
+    def test_formula_cells_are_quoted(self):
+        _create_employee(1, first_name="=HYPERLINK(\"http://x\")", last_name="+1")
+        _create_employee(2, first_name="-2", last_name="@SUM(A1)")
+
+        cells = [cell for row in self._export_rows()[1:] for cell in row[1:3]]
+
+        self.assertEqual(cells, ["'=HYPERLINK(\"http://x\")", "'+1", "'-2", "'@SUM(A1)"])
+
+    def test_employees_cannot_export(self):
+        employee = _create_employee(1)
+        self.client.force_login(employee)
+
+        response = self.client.get(reverse("manager_employees_export"))
+
+        self.assertRedirects(response, reverse("employee_shifts"), fetch_redirect_response=False)
+
+
+class ManagerEmployeesPaginationTests(ManagerEmployeesTestBase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        for index in range(EMPLOYEES_PER_PAGE + 1):
+            _create_employee(index)
+
+    def test_first_page_links_to_next_only(self):
+        response = self.client.get(reverse("manager_employees"))
+
+        self.assertEqual(len(response.context["employees"]), EMPLOYEES_PER_PAGE)
+        self.assertContains(response, 'href="?page=2"')
+        self.assertNotContains(response, ">Previous<")
+
+    def test_last_page_links_to_previous_only(self):
+        response = self.client.get(reverse("manager_employees"), {"page": 2})
+
+        self.assertEqual([e.email for e in response.context["employees"]], [f"employee{EMPLOYEES_PER_PAGE:03d}@example.com"])
+        self.assertContains(response, 'href="?page=1"')
+        self.assertNotContains(response, ">Next<")
+
+    def test_invalid_page_falls_back_to_a_valid_one(self):
+        self.assertEqual(self.client.get(reverse("manager_employees"), {"page": "x"}).context["page_obj"].number, 1)
+        self.assertEqual(self.client.get(reverse("manager_employees"), {"page": 99}).context["page_obj"].number, 2)
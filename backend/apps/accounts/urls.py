@@ -8,6 +8,7 @@ urlpatterns = [
     path("login/", views.login_view, name="login"),
     path("logout/", views.logout_view, name="logout"),
     path("manager/employees/", views.manager_employees, name="manager_employees"),
+    path("manager/employees/export/", views.manager_employees_export, name="manager_employees_export"),
     path("manager/employees/create/", views.manager_employees_create, name="manager_employees_create"),
     path("manager/employees/<int:user_id>/update/", views.employee_update, name="employee_update"),
     path("manager/employees/<int:user_id>/reset-password/", views.reset_employee_password, name="reset_employee_password"),
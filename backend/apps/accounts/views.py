@@ -1,20 +1,28 @@
 from __future__ import annotations
 
+import csv
+from itertools import chain
+
 from django.contrib import messages
 from django.contrib.auth import login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.forms import AuthenticationForm
 from django.conf import settings
-from django.http import HttpRequest, HttpResponse
+from django.core.paginator import Paginator
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views.decorators.http import require_GET, require_http_methods, require_POST
 
-from apps.scheduling.models import Position
+from apps.scheduling.services import ordered_positions
 
 from .decorators import manager_required
 from .forms import CreateEmployeeForm, UpdateEmployeeForm
 from .models import User, UserRole
 
+EMPLOYEES_PER_PAGE = 50
+EMPLOYEES_EXPORT_CHUNK_SIZE = 500
+EMPLOYEES_EXPORT_HEADER = ("Employee ID", "First name", "Last name", "Email", "Position")
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
 
 def _redirect_with_message(
     request: HttpRequest,
@@ -27,8 +35,16 @@ def _redirect_with_message(
     return redirect(to)
 
 def _get_employee_or_404(user_id: int) -> User:
-    qs = User.objects.select_related("position")
-    return get_object_or_404(qs, pk=user_id, role=UserRole.EMPLOYEE)
+    return get_object_or_404(User, pk=user_id, role=UserRole.EMPLOYEE)
+
+def _csv_safe(value: str | None) -> str:
+    """Quote cells that spreadsheet apps would otherwise run as formulas."""
+    value = value or ""
+    return f"'{value}" if value.startswith(CSV_FORMULA_PREFIXES) else value
+
+class _Echo:
+    def write(self, value: str) -> str:
+        return value
 
 def _store_one_time_credentials(request: HttpRequest, employee: User, password: str) -> None:
     request.session["one_time_credentials"] = {
@@ -66,14 +82,43 @@ def manager_employees(request: HttpRequest) -> HttpResponse:
     form = CreateEmployeeForm()
     creds = request.session.pop("one_time_credentials", None)
 
-    employees = User.objects.filter(role=UserRole.EMPLOYEE).select_related("position")
-    positions = Position.objects.order_by("name")
+    employees = (
+        User.objects.filter(role=UserRole.EMPLOYEE)
+        .select_related("position")
+        .only("username", "first_name", "last_name", "email", "employee_id", "position__name")
+        .order_by("last_name", "first_name", "username")
+    )
+    page_obj = Paginator(employees, EMPLOYEES_PER_PAGE).get_page(request.GET.get("page"))
+    positions = ordered_positions()
     return render(
         request,
         "manager/manager-employees.html",
-        {"employees": employees, "positions": positions, "form": form, "creds": creds},
+        {
+            "employees": page_obj.object_list,
+            "page_obj": page_obj,
+            "positions": positions,
+            "form": form,
+            "creds": creds,
+        },
     )
 
+@manager_required
+@require_GET
+def manager_employees_export(request: HttpRequest) -> StreamingHttpResponse:
+    rows = (
+        User.objects.filter(role=UserRole.EMPLOYEE)
+        .order_by("last_name", "first_name", "username")
+        .values_list("employee_id", "first_name", "last_name", "email", "position__name")
+        .iterator(chunk_size=EMPLOYEES_EXPORT_CHUNK_SIZE)
+    )
+    writer = csv.writer(_Echo())
+    response = StreamingHttpResponse(
+        (writer.writerow([_csv_safe(cell) for cell in row]) for row in chain([EMPLOYEES_EXPORT_HEADER], rows)),
+        content_type="text/csv",
+    )
+    response["Content-Disposition"] = 'attachment; filename="employees.csv"'
+    return response
+
 @manager_required
 @require_POST
 def manager_employees_create(request: HttpRequest) -> HttpResponse:
@@ -101,7 +146,9 @@ def employee_update(request: HttpRequest, user_id: int) -> HttpResponse:
 @manager_required
 @require_POST
 def reset_employee_password(request: HttpRequest, user_id: int) -> HttpResponse:
-    employee = _get_employee_or_404(user_id)
+    employee = get_object_or_404(
+        User.objects.only("email", "employee_id"), pk=user_id, role=UserRole.EMPLOYEE
+    )
     password = User.generate_password()
     employee.set_password(password)
     employee.save(update_fields=["password"])
@@ -4,3 +4,6 @@ class SchedulingConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.scheduling"
     label = "scheduling"
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401
@@ -20,6 +20,8 @@ class ShiftForm(forms.ModelForm):
         required=False,
     )
 
+    derived_fields = ["status", "updated_at"]
+
     class Meta:
         model = Shift
         fields = ["date", "start_time", "end_time", "position", "capacity"]
@@ -44,5 +46,8 @@ class ShiftForm(forms.ModelForm):
         else:
             instance.status = ShiftStatus.DRAFT
         if commit:
-            instance.save()
+            if instance.pk:
+                instance.save(update_fields=[*self._meta.fields, *self.derived_fields])
+            else:
+                instance.save()
         return instance
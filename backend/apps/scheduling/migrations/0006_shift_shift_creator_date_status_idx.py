@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 02:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduling', '0005_remove_created_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='shift',
+            index=models.Index(fields=['created_by', 'date', 'status'], name='shift_creator_date_status_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 02:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduling', '0006_shift_shift_creator_date_status_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['employee', 'shift'], name='assignment_employee_shift_idx'),
+        ),
+    ]
@@ -7,6 +7,8 @@ from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils import timezone
 
+POSITION_NAME_MAX_LENGTH = 25
+
 def _validate_time_range_and_capacity(*, start_time, end_time, capacity) -> None:
     errors: dict[str, str] = {}
     if start_time and end_time and start_time >= end_time:
@@ -22,8 +24,8 @@ class Position(models.Model):
 
     def clean(self) -> None:
         name = (self.name or "").strip()
-        if len(name) > 25:
-            raise ValidationError({"name": "Position name must be max 25 characters."})
+        if len(name) > POSITION_NAME_MAX_LENGTH:
+            raise ValidationError({"name": f"Position name must be max {POSITION_NAME_MAX_LENGTH} characters."})
         self.name = name
 
     def __str__(self) -> str:
@@ -33,6 +35,12 @@ class ShiftStatus(models.TextChoices):
     DRAFT = "draft", "Draft"
     PUBLISHED = "published", "Published"
 
+class ShiftQuerySet(models.QuerySet):
+    def with_is_past(self, now: datetime) -> ShiftQuerySet:
+        today = now.date()
+        ended = models.Q(date__lt=today) | models.Q(date=today, end_time__lt=now.time())
+        return self.annotate(is_past=models.ExpressionWrapper(ended, output_field=models.BooleanField()))
+
 class Shift(models.Model):
     date = models.DateField()
     start_time = models.TimeField()
@@ -55,18 +63,26 @@ class Shift(models.Model):
     )
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ShiftQuerySet.as_manager()
+
     class Meta:
         ordering = ["date", "start_time"]
+        indexes = [
+            models.Index(fields=["created_by", "date", "status"], name="shift_creator_date_status_idx"),
+        ]
+
     def clean(self) -> None:
         _validate_time_range_and_capacity(
             start_time=self.start_time,
             end_time=self.end_time,
             capacity=self.capacity,
         )
+    def is_past_at(self, now: datetime) -> bool:
+        return datetime.combine(self.date, self.end_time, tzinfo=now.tzinfo) < now
+
     @property
     def is_past(self) -> bool:
-        dt_end = datetime.combine(self.date, self.end_time, tzinfo=timezone.get_current_timezone())
-        return dt_end < timezone.now()
+        return self.is_past_at(timezone.localtime())
 
 class Assignment(models.Model):
 
@@ -87,6 +103,9 @@ class Assignment(models.Model):
                 name="unique_employee_per_shift"
             ),
         ]
+        indexes = [
+            models.Index(fields=["employee", "shift"], name="assignment_employee_shift_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.employee.employee_id} -> {self.shift_id}"
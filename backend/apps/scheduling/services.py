@@ -3,48 +3,61 @@ from __future__ import annotations
 from datetime import date
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db import models
-from .models import Assignment, EmployeeUnavailability, Shift, ShiftStatus
+from django.db.models.functions import Coalesce
+from .models import Assignment, EmployeeUnavailability, Position, Shift, ShiftStatus
 
-def _normalize_employee_ids(employee_ids: list[int]) -> list[int]:
-    return list(dict.fromkeys(employee_ids))
+POSITIONS_CACHE_KEY = "positions:ordered"
+POSITIONS_CACHE_TIMEOUT = 60
+SHIFT_STATUS_FILTERS = frozenset({ShiftStatus.DRAFT, ShiftStatus.PUBLISHED})
+EMPLOYEE_SHIFT_FIELDS = ("date", "start_time", "end_time", "position__name")
 
+def ordered_positions() -> list[Position]:
+    positions = cache.get(POSITIONS_CACHE_KEY)
+    if positions is None:
+        positions = list(Position.objects.order_by("name"))
+        cache.set(POSITIONS_CACHE_KEY, positions, POSITIONS_CACHE_TIMEOUT)
+    return positions
 
-def _check_position_match(shift: Shift, employee_ids: list[int]) -> None:
-    if not employee_ids:
-        return
 
-    User = get_user_model()
-    valid_ids = set(
-        User.objects.filter(
-            id__in=employee_ids,
-            role="employee",
-            is_active=True,
-            position_id=shift.position_id,
-        ).values_list("id", flat=True)
-    )
-    if len(valid_ids) != len(employee_ids):
-        raise ValidationError("Selected employees must match the shift position.")
+def invalidate_positions_cache() -> None:
+    cache.delete(POSITIONS_CACHE_KEY)
 
 
-def _check_capacity(shift: Shift, employee_ids: list[int]) -> None:
+def _check_capacity(shift: Shift, employee_ids: set[int]) -> None:
     if len(employee_ids) > shift.capacity:
         raise ValidationError("Cannot assign more employees than shift capacity.")
 
 
-def _check_availability(shift: Shift, employee_ids: list[int]) -> None:
+def _check_position_and_availability(shift: Shift, employee_ids: set[int]) -> None:
     if not employee_ids:
         return
-    has_unavailable = EmployeeUnavailability.objects.filter(
-        employee_id__in=employee_ids,
-        date=shift.date,
-    ).exists()
-    if has_unavailable:
+
+    User = get_user_model()
+    rows = User.objects.filter(
+        id__in=employee_ids,
+        role="employee",
+        is_active=True,
+        position_id=shift.position_id,
+    ).values_list(
+        "id",
+        models.Exists(
+            EmployeeUnavailability.objects.filter(
+                employee_id=models.OuterRef("pk"),
+                date=shift.date,
+            )
+        ),
+    )
+    unavailable = dict(rows)
+    if employee_ids - unavailable.keys():
+        raise ValidationError("Selected employees must match the shift position.")
+    if any(unavailable.values()):
         raise ValidationError(f"Employee is unavailable on {shift.date.isoformat()}.")
 
 
-def _check_no_overlap(shift: Shift, employee_ids: list[int]) -> None:
+def _check_no_overlap(shift: Shift, employee_ids: set[int]) -> None:
     if not employee_ids:
         return
 
@@ -57,6 +70,7 @@ def _check_no_overlap(shift: Shift, employee_ids: list[int]) -> None:
         )
         .exclude(shift_id=shift.id)
         .select_related("shift__position")
+        .only("shift__date", "shift__start_time", "shift__end_time", "shift__position__name")
         .order_by("shift__start_time")
         .first()
     )
@@ -70,18 +84,20 @@ def _check_no_overlap(shift: Shift, employee_ids: list[int]) -> None:
     raise ValidationError(f"Employee already assigned to: {overlapping.position} {start}–{end} ({day})")
 
 
-def _sync_assignments(shift: Shift, employee_ids: list[int]) -> None:
-    Assignment.objects.filter(shift=shift).delete()
+def _sync_assignments(shift: Shift, employee_ids: set[int]) -> None:
+    Assignment.objects.filter(shift=shift).exclude(employee_id__in=employee_ids).delete()
     if not employee_ids:
         return
-    Assignment.objects.bulk_create([Assignment(shift=shift, employee_id=eid) for eid in employee_ids])
+    Assignment.objects.bulk_create(
+        [Assignment(shift=shift, employee_id=eid) for eid in employee_ids],
+        ignore_conflicts=True,
+    )
 
 
 def assign_employees_to_shift(shift: Shift, employee_ids: list[int]) -> None:
-    employee_ids = _normalize_employee_ids(employee_ids)
-    _check_position_match(shift, employee_ids)
+    employee_ids = set(employee_ids)
     _check_capacity(shift, employee_ids)
-    _check_availability(shift, employee_ids)
+    _check_position_and_availability(shift, employee_ids)
     _check_no_overlap(shift, employee_ids)
     _sync_assignments(shift, employee_ids)
 
@@ -99,10 +115,19 @@ def shifts_for_manager(
     qs = Shift.objects.filter(created_by_id=manager_id, date__gte=start, date__lte=end).select_related("position")
     if position_ids:
         qs = qs.filter(position_id__in=position_ids)
-    if status in (ShiftStatus.DRAFT, ShiftStatus.PUBLISHED):
+    if status in SHIFT_STATUS_FILTERS:
         qs = qs.filter(status=status)
     if understaffed_only:
-        qs = qs.annotate(assigned_total=models.Count("assignments")).filter(assigned_total__lt=models.F("capacity"))
+        assigned_total = (
+            Assignment.objects.filter(shift_id=models.OuterRef("pk"))
+            .order_by()
+            .values("shift_id")
+            .annotate(total=models.Count("*"))
+            .values("total")
+        )
+        qs = qs.alias(
+            assigned_total=Coalesce(models.Subquery(assigned_total, output_field=models.IntegerField()), 0)
+        ).filter(assigned_total__lt=models.F("capacity"))
     return qs
 
 def shifts_for_employee(*, employee_id: int, start: date, end: date):
@@ -115,6 +140,7 @@ def shifts_for_employee(*, employee_id: int, start: date, end: date):
             status=ShiftStatus.PUBLISHED,
         )
         .select_related("position")
+        .only(*EMPLOYEE_SHIFT_FIELDS)
         .distinct()
         .order_by("date", "start_time")
     )
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Position
+from .services import invalidate_positions_cache
+
+
+@receiver(post_save, sender=Position)
+@receiver(post_delete, sender=Position)
+def _position_changed(sender, **kwargs) -> None:
+    invalidate_positions_cache()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from datetime import date, time
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.accounts.models import User, UserRole
+
+from .models import Assignment, Position, Shift, ShiftStatus
+from .services import ordered_positions, shifts_for_employee
+from .use_cases import publish_shifts_in_period
+
+
+class OrderedPositionsCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        Position.objects.create(name="Cook")
+        Position.objects.create(name="Barista")
+
+    def test_repeat_calls_are_served_from_cache(self):
+        self.assertEqual([p.name for p in ordered_positions()], ["Barista", "Cook"])
+        with self.assertNumQueries(0):
+            self.assertEqual([p.name for p in ordered_positions()], ["Barista", "Cook"])
+
+    def test_saving_a_position_invalidates_the_cache(self):
+        ordered_positions()
+        Position.objects.create(name="Cashier")
+        cook = Position.objects.get(name="Cook")
+        cook.is_active = False
+        cook.save()
+
+        positions = ordered_positions()
+
+        self.assertEqual([p.name for p in positions], ["Barista", "Cashier", "Cook"])
+        self.assertFalse(positions[2].is_active)
+
+    def test_deleting_a_position_invalidates_the_cache(self):
+        ordered_positions()
+        Position.objects.get(name="Cook").delete()
+
+        self.assertEqual([p.name for p in ordered_positions()], ["Barista"])
+
+
+class ShiftsForEmployeeTests(TestCase):
+    start = date(2030, 1, 1)
+    end = date(2030, 1, 31)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.manager = User.objects.create_user("manager@example.com", role=UserRole.MANAGER)
+        cls.employee = User.objects.create_user("employee@example.com", role=UserRole.EMPLOYEE)
+        cls.shift = Shift.objects.create(
+            date=date(2030, 1, 7),
+            start_time=time(9),
+            end_time=time(13),
+            position=Position.objects.create(name="Barista"),
+            created_by=cls.manager,
+        )
+
+    def _shift_ids(self) -> list[int]:
+        return [s.id for s in shifts_for_employee(employee_id=self.employee.id, start=self.start, end=self.end)]
+
+    def test_reflects_assignment_writes_immediately(self):
+        self.shift.status = ShiftStatus.PUBLISHED
+        self.shift.save()
+        self.assertEqual(self._shift_ids(), [])
+
+        assignment = Assignment.objects.create(shift=self.shift, employee=self.employee)
+        self.assertEqual(self._shift_ids(), [self.shift.id])
+
+        assignment.delete()
+        self.assertEqual(self._shift_ids(), [])
+
+    def test_draft_shifts_appear_once_the_period_is_published(self):
+        Assignment.objects.create(shift=self.shift, employee=self.employee)
+        self.assertEqual(self._shift_ids(), [])
+
+        published = publish_shifts_in_period(manager_id=self.manager.id, start=self.start, end=self.end)
+
+        self.assertEqual(published, 1)
+        self.assertEqual(self._shift_ids(), [self.shift.id])
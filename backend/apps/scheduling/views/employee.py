@@ -3,10 +3,8 @@ from __future__ import annotations
 import json
 
 from django.core.exceptions import ValidationError
-from django.core.serializers.json import DjangoJSONEncoder
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import render
-from django.urls import reverse
 from django.utils import timezone
 from django.views.decorators.http import require_GET, require_POST
 
@@ -14,14 +12,15 @@ from apps.accounts.decorators import employee_required
 
 from ..models import Assignment, EmployeeUnavailability
 from ..services import shifts_for_employee
-from .helpers import _parse_date, _parse_required_date, _month_bounds
+from .helpers import _parse_date, _parse_required_date, _month_bounds, _route_url
 
 
 @employee_required
 @require_GET
 def employee_shifts_view(request: HttpRequest) -> HttpResponse:
 
-    today = timezone.localdate()
+    now = timezone.localtime()
+    today = now.date()
     anchor = _parse_date(request.GET.get("date"), today)
     start, end = _month_bounds(anchor)
     period_label = anchor.strftime("%B %Y")
@@ -34,18 +33,19 @@ def employee_shifts_view(request: HttpRequest) -> HttpResponse:
             "start_time": s.start_time.strftime("%H:%M"),
             "end_time": s.end_time.strftime("%H:%M"),
             "position": s.position.name,
-            "is_past": s.is_past,
+            "is_past": s.is_past_at(now),
         }
         for s in shift_qs
     ]
 
-    unavailable_days = list(
-        EmployeeUnavailability.objects.filter(
+    unavailable_days = [
+        d.isoformat()
+        for d in EmployeeUnavailability.objects.filter(
             employee_id=request.user.id,
             date__gte=start,
             date__lte=end,
         ).values_list("date", flat=True)
-    )
+    ]
 
     return render(
         request,
@@ -56,12 +56,9 @@ def employee_shifts_view(request: HttpRequest) -> HttpResponse:
             "end": end,
             "period_label": period_label,
             "today": today,
-            "toggle_url": reverse("employee_unavailability_toggle"),
-            "shifts_json": json.dumps(shifts_payload, cls=DjangoJSONEncoder),
-            "unavailable_json": json.dumps(
-                [d.isoformat() for d in unavailable_days],
-                cls=DjangoJSONEncoder,
-            ),
+            "toggle_url": _route_url("employee_unavailability_toggle"),
+            "shifts_json": json.dumps(shifts_payload),
+            "unavailable_json": json.dumps(unavailable_days),
         },
     )
 
@@ -100,12 +97,11 @@ def employee_unavailability_toggle(request: HttpRequest) -> JsonResponse:
             status=400,
         )
 
-    obj = EmployeeUnavailability.objects.filter(
+    deleted, _ = EmployeeUnavailability.objects.filter(
         employee_id=request.user.id, date=day
-    ).first()
+    ).delete()
 
-    if obj:
-        obj.delete()
+    if deleted:
         return JsonResponse({"ok": True, "date": day.isoformat(), "unavailable": False})
 
     EmployeeUnavailability.objects.create(employee_id=request.user.id, date=day)
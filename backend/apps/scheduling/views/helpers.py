@@ -1,24 +1,43 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from datetime import date, datetime, timedelta
 
 from django.contrib import messages
 from django.core.exceptions import ValidationError
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import redirect
-from django.urls import reverse
+from django.urls import get_script_prefix, reverse
 
 from ..models import Shift
 from ..use_cases import save_shift as save_shift_use_case
 
 
+def _fast_date(value: str) -> date:
+    """Parse YYYY-MM-DD by slicing, falling back to strptime for other shapes."""
+    if (
+        len(value) == 10
+        and value.isascii()
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:].isdigit()
+    ):
+        try:
+            return date(int(value[:4]), int(value[5:7]), int(value[8:]))
+        except ValueError:
+            pass
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
 def _parse_date(value: str | None, default: date) -> date:
     """Parse YYYY-MM-DD date string, return default if invalid."""
     if not value:
         return default
     try:
-        return datetime.strptime(value, "%Y-%m-%d").date()
+        return _fast_date(value)
     except ValueError:
         return default
 
@@ -27,7 +46,7 @@ def _parse_required_date(value: str | None, field: str) -> date:
     """Parse required YYYY-MM-DD date string, raise ValidationError if invalid."""
     raw = (value or "").strip()
     try:
-        return datetime.strptime(raw, "%Y-%m-%d").date()
+        return _fast_date(raw)
     except (TypeError, ValueError):
         raise ValidationError({field: "Enter a valid date."})
 
@@ -55,7 +74,12 @@ class PeriodContext:
 
 
 def _build_period_context(view_raw: str | None, anchor: date) -> PeriodContext:
-    view = (view_raw or "week").lower()
+    view = "month" if (view_raw or "").lower() == "month" else "week"
+    return _period_context(view, anchor)
+
+
+@lru_cache(maxsize=512)
+def _period_context(view: str, anchor: date) -> PeriodContext:
     if view == "month":
         start, end = _month_bounds(anchor)
         label = anchor.strftime("%B %Y")
@@ -68,6 +92,16 @@ def _build_period_context(view_raw: str | None, anchor: date) -> PeriodContext:
         label = f"{start.strftime('%d')}. {start.strftime('%b')} - {end.strftime('%d')}. {end.strftime('%b')}"
     return PeriodContext(view="week", anchor=anchor, start=start, end=end, label=label)
 
+@cache
+def _resolve_route(name: str, script_prefix: str) -> str:
+    return reverse(name)
+
+
+def _route_url(name: str) -> str:
+    """Resolve an argument-free route once per name and script prefix."""
+    return _resolve_route(name, get_script_prefix())
+
+
 def _redirect_with_message(
     request: HttpRequest,
     *,
@@ -85,7 +119,7 @@ def _manager_shifts_url_showing_shift(request: HttpRequest, shift: Shift) -> str
     view = (request.POST.get("return_view") or "week").strip().lower()
     if view not in {"week", "month"}:
         view = "week"
-    return f"{reverse('manager_shifts')}?view={view}&date={shift.date.isoformat()}"
+    return f"{_route_url('manager_shifts')}?view={view}&date={shift.date.isoformat()}"
 
 
 def _save_shift_from_post(
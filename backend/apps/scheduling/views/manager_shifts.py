@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import json
+import re
 
 from django.contrib import messages
-from django.core.serializers.json import DjangoJSONEncoder
-from django.db.models import Count, Prefetch
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404, render
 from django.utils import timezone
@@ -13,8 +12,8 @@ from django.views.decorators.http import require_GET, require_POST
 from apps.accounts.decorators import manager_required
 from apps.accounts.models import User, UserRole
 
-from ..models import Assignment, Position, Shift
-from ..services import shifts_for_manager
+from ..models import Assignment, Shift
+from ..services import ordered_positions, shifts_for_manager
 from ..use_cases import publish_shift as publish_shift_use_case, publish_shifts_in_period
 from .helpers import (
     PeriodContext,
@@ -25,56 +24,53 @@ from .helpers import (
     _save_shift_from_post,
 )
 
+_ID_RE = re.compile(r"[0-9]+")
+
 
 def _build_shift_payload(shift_qs):
-    shifts = (
-        shift_qs.annotate(assigned_count=Count("assignments"))
-        .prefetch_related(
-            Prefetch(
-                "assignments",
-                queryset=Assignment.objects.only("employee_id"),
-                to_attr="prefetched_assignments",
-            )
+    rows = list(
+        shift_qs.with_is_past(timezone.localtime()).values(
+            "id", "date", "start_time", "end_time", "position_id", "position__name", "capacity", "status", "is_past"
         )
     )
-
-    now_local = timezone.localtime()
-    today = now_local.date()
-    current_time = now_local.time().replace(tzinfo=None)
+    assigned_by_shift: dict[int, list[int]] = {}
+    if rows:
+        assignments = Assignment.objects.filter(shift_id__in=[row["id"] for row in rows]).values_list(
+            "shift_id", "employee_id"
+        )
+        for shift_id, employee_id in assignments:
+            assigned_by_shift.setdefault(shift_id, []).append(employee_id)
 
     payload = []
-    for shift in shifts:
-        assigned_ids = [a.employee_id for a in getattr(shift, "prefetched_assignments", [])]
-        shift_date = shift.date
-        shift_end = shift.end_time
-        is_past = shift_date < today or (shift_date == today and shift_end < current_time)
+    for row in rows:
+        assigned_ids = assigned_by_shift.get(row["id"], [])
         payload.append(
             {
-                "id": shift.id,
-                "date": shift_date.isoformat(),
-                "start_time": shift.start_time.strftime("%H:%M"),
-                "end_time": shift_end.strftime("%H:%M"),
-                "position": shift.position.name,
-                "position_id": shift.position_id,
-                "capacity": shift.capacity,
-                "assigned_count": shift.assigned_count,
+                "id": row["id"],
+                "date": row["date"].isoformat(),
+                "start_time": row["start_time"].strftime("%H:%M"),
+                "end_time": row["end_time"].strftime("%H:%M"),
+                "position": row["position__name"],
+                "position_id": row["position_id"],
+                "capacity": row["capacity"],
+                "assigned_count": len(assigned_ids),
                 "assigned_employee_ids": assigned_ids,
-                "status": shift.status,
-                "is_past": is_past,
+                "status": row["status"],
+                "is_past": row["is_past"],
             }
         )
     return payload
 
 
-def _build_employee_payload(employee_qs):
+def _build_employee_payload(employee_rows):
     return [
         {
-            "id": e.id,
-            "name": (e.get_full_name() or "").strip() or e.username,
-            "position_id": e.position_id,
-            "position": e.position.name if e.position else "",
+            "id": employee_id,
+            "name": f"{first_name} {last_name}".strip() or username,
+            "position_id": position_id,
+            "position": position_name or "",
         }
-        for e in employee_qs
+        for employee_id, first_name, last_name, username, position_id, position_name in employee_rows
     ]
 
 
@@ -89,8 +85,8 @@ def manager_shifts(request: HttpRequest) -> HttpResponse:
     anchor = _parse_date(request.GET.get("date"), today)
     period: PeriodContext = _build_period_context(request.GET.get("view") or "week", anchor)
 
-    positions = Position.objects.filter(is_active=True).order_by("name")
-    selected_positions = [int(p) for p in request.GET.getlist("positions") if p.isdigit()]
+    positions = [p for p in ordered_positions() if p.is_active]
+    selected_positions = [int(p) for p in request.GET.getlist("positions") if _ID_RE.fullmatch(p)]
     status = (request.GET.get("status") or "").lower()
     understaffed = (request.GET.get("show") or "").lower() == "understaffed"
 
@@ -103,10 +99,12 @@ def manager_shifts(request: HttpRequest) -> HttpResponse:
         understaffed_only=understaffed,
     )
 
-    employee_qs = User.objects.filter(role=UserRole.EMPLOYEE, is_active=True).select_related("position").order_by(
-        "last_name", "first_name", "username"
+    employee_rows = (
+        User.objects.filter(role=UserRole.EMPLOYEE, is_active=True)
+        .order_by("last_name", "first_name", "username")
+        .values_list("id", "first_name", "last_name", "username", "position_id", "position__name")
     )
-    employees = list(employee_qs)
+    employees = _build_employee_payload(employee_rows)
 
     return render(
         request,
@@ -123,8 +121,8 @@ def manager_shifts(request: HttpRequest) -> HttpResponse:
             "selected_positions": selected_positions,
             "status": status,
             "understaffed": understaffed,
-            "shifts_json": json.dumps(_build_shift_payload(shift_qs), cls=DjangoJSONEncoder),
-            "employees_json": json.dumps(_build_employee_payload(employees), cls=DjangoJSONEncoder),
+            "shifts_json": json.dumps(_build_shift_payload(shift_qs)),
+            "employees_json": json.dumps(employees),
         },
     )
 